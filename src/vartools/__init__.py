@@ -58,7 +58,7 @@ from vartools.optimization import OptimizePortfolioWeights
 from vartools.backtesting import DynamicBacktesting
 
 # Derivatives (Black-Scholes)
-from vartools.derivatives import BlackScholes
+from vartools.derivatives import BlackScholes, call_delta, put_delta, delta_hedge
 
 # Fixed income (Bonds)
 from vartools.fixed_income import Bond
@@ -84,6 +84,9 @@ __all__ = [
     "DynamicBacktesting",
     # Derivatives
     "BlackScholes",
+    "call_delta",
+    "put_delta",
+    "delta_hedge",
     # Fixed Income
     "Bond",
 ]
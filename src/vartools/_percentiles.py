@@ -0,0 +1,155 @@
+"""Internal percentile helpers shared by the risk and optimization modules."""
+
+import numpy as np
+
+
+def _percentile_rank(n: int, q: float) -> tuple[float, int, int]:
+    """
+    Locate the q-th percentile of n sorted values the way np.percentile does.
+
+    Parameters
+    ----------
+    n : int
+        The number of values.
+    q : float
+        The percentile, between 0 and 100.
+
+    Returns
+    -------
+    h, lo, hi : tuple[float, int, int]
+        The fractional rank of the percentile and the positions of the two order statistics
+        it is interpolated between.
+    """
+    h = (n - 1) * (q / 100)
+    lo = int(h)
+    return h, lo, min(lo + 1, n - 1)
+
+
+def _partition_percentiles(returns: np.ndarray, qs, overwrite_input: bool = False) -> tuple[np.ndarray, list, list]:
+    """
+    Compute several percentiles with one np.partition shared by all of them.
+
+    Only the order statistics around each percentile are placed, and they are interpolated
+    linearly exactly as np.percentile does.
+
+    Parameters
+    ----------
+    returns : np.ndarray
+        A 1D array of portfolio returns, or a 2D array with one column per portfolio.
+    qs : sequence of float
+        The percentiles to compute, between 0 and 100.
+    overwrite_input : bool
+        Whether to partition the returns in place instead of a copy of them.
+
+    Returns
+    -------
+    part, ranks, vars : tuple[np.ndarray, list, list]
+        The partitioned returns, the (h, lo, hi) rank of each percentile as given by
+        _percentile_rank, and the percentiles themselves (one per column for 2D returns),
+        in the order of qs.
+    """
+    ranks = [_percentile_rank(returns.shape[0], q) for q in qs]
+    kth = sorted({k for _, lo, hi in ranks for k in (lo, hi)})
+    if overwrite_input:
+        returns.partition(kth, axis=0)
+        part = returns
+    else:
+        part = np.partition(returns, kth, axis=0)
+    var = [part[lo] + (h - lo) * (part[hi] - part[lo]) for h, lo, hi in ranks]
+    return part, ranks, var
+
+
+def _tail(part: np.ndarray, lo: int, hi: int, var, left: bool = True, inclusive: bool = False) -> np.ndarray:
+    """
+    The part of the partitioned returns that holds every return in the tail.
+
+    Parameters
+    ----------
+    part : np.ndarray
+        The returns partitioned around positions lo and hi, as given by _partition_percentiles.
+    lo, hi : int
+        The positions of the order statistics around the percentile.
+    var : float | np.ndarray
+        The percentile, one per column for 2D returns.
+    left : bool
+        Whether the tail lies below the percentile (long positions) or above it (short positions).
+    inclusive : bool
+        Whether returns equal to the percentile belong to the tail.
+
+    Returns
+    -------
+    tail : np.ndarray
+        A view of the partitioned returns that contains the tail, to be reduced with _tail_mean.
+    """
+    # Everything after hi is at least part[hi] >= var, and everything before lo at most part[lo] <= var,
+    # so a strict tail lies in that prefix (suffix). Ties with var can sit on either side of hi (lo),
+    # so an inclusive tail only fits in it when the order statistic is not itself equal to var
+    if left:
+        return part if inclusive and np.any(part[hi] == var) else part[:hi + 1]
+    return part if inclusive and np.any(part[lo] == var) else part[lo:]
+
+
+def _tail_mean(returns: np.ndarray, var, left: bool = True, inclusive: bool = False):
+    """
+    Mean of the returns beyond a threshold, as a masked sum over a count.
+
+    The returns outside the tail are zeroed with np.where and the result is reduced in one
+    contiguous pass, instead of first gathering the tail into a new array by boolean indexing.
+    The sum is always accumulated in float64, so single-precision returns do not lose
+    accuracy on long tails.
+
+    Parameters
+    ----------
+    returns : np.ndarray
+        A 1D array of portfolio returns, or a 2D array with one column per portfolio.
+    var : float | np.ndarray
+        The threshold that delimits the tail, one per column for 2D returns.
+    left : bool
+        Whether the tail lies below the threshold (long positions) or above it (short positions).
+    inclusive : bool
+        Whether returns equal to the threshold belong to the tail (`<=`, `>=`) or not (`<`, `>`).
+
+    Returns
+    -------
+    cvar : float | np.ndarray
+        The mean of the returns in the tail (one per column for 2D returns), or NaN if the tail is empty.
+    """
+    axis = 0 if returns.ndim > 1 else None
+    if left:
+        in_tail = returns <= var if inclusive else returns < var
+    else:
+        in_tail = returns >= var if inclusive else returns > var
+    n = np.count_nonzero(in_tail, axis=axis)
+    total = np.where(in_tail, returns, 0.0).sum(axis=axis, dtype=np.float64)
+    with np.errstate(invalid='ignore'):
+        cvar = total / n
+    return cvar if axis is not None else float(cvar)
+
+
+def _left_tail_days(returns: np.ndarray, q: float, inclusive: bool = False) -> np.ndarray:
+    """
+    Positions of the returns below the q-th percentile.
+
+    np.partition places the two order statistics around the percentile, so it is found
+    without sorting the returns.
+
+    Parameters
+    ----------
+    returns : np.ndarray
+        A 1D array of portfolio returns.
+    q : float
+        The percentile, between 0 and 100.
+    inclusive : bool
+        Whether returns equal to the percentile belong to the tail (`<=`) or not (`<`).
+
+    Returns
+    -------
+    days : np.ndarray
+        The positions of the tail returns, in date order, so sums over the tail keep the
+        chronological order of a boolean mask.
+    """
+    _, _, (var,) = _partition_percentiles(returns, [q])
+
+    # Returns tied with the percentile can be placed on either side of hi, so the whole array is compared
+    in_tail = returns <= var if inclusive else returns < var
+    return np.flatnonzero(in_tail)
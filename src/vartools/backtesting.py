@@ -1,10 +1,114 @@
 """Dynamic backtesting for portfolio optimization strategies."""
 
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pandas as pd
+import scipy
 
 from vartools.optimization import OptimizePortfolioWeights
 
+# Estrategias en el mismo orden en que las devuelve optimize_weights
+_STRATEGIES = ('Min Variance', 'Sharpe', 'Semivariance', 'Omega', 'Min CVaR', 'MCC')
+
+# SLSQP solo es seguro entre hilos desde SciPy 1.16, cuando su código Fortran se reescribió en C
+_SLSQP_THREAD_SAFE = tuple(int(part) for part in scipy.__version__.split('.')[:2]) >= (1, 16)
+
+
+class _RollingCovariance:
+    """
+    Sample covariance of a sliding window of returns, updated incrementally.
+
+    Keeps the sum and the sum of outer products of the rows in the window, so moving
+    the window only costs the rows that enter or leave it instead of a full recompute.
+    """
+
+    def __init__(self):
+        self.source = None
+        self.bounds = (0, 0)
+        self.window = None
+        self.s = None
+        self.ss = None
+
+    def update(self, source, window: np.ndarray, lo: int, hi: int) -> np.ndarray:
+        """
+        Move the window and return its covariance matrix.
+
+        Parameters
+        -----------
+        source : object
+            The object the returns were taken from. A different source forces a full recompute.
+        window : np.ndarray
+            The returns currently in the window, one row per day and one column per asset.
+        lo : int
+            Absolute position of the first row of the window within the source.
+        hi : int
+            Absolute position one past the last row of the window within the source.
+
+        Returns:
+        -----------
+        cov : np.ndarray
+            The sample covariance matrix of the window.
+        """
+        prev_lo, prev_hi = self.bounds
+        incremental = (
+            source is self.source
+            and window.shape[0] == hi - lo
+            and window.shape[1] == self.window.shape[1]
+            and prev_lo <= lo < prev_hi <= hi
+            and 2 * (lo - prev_lo) < window.shape[0]
+        )
+
+        if incremental:
+            leaving = self.window[:lo - prev_lo]
+            entering = window[prev_hi - lo:]
+            self.s += entering.sum(axis=0) - leaving.sum(axis=0)
+            self.ss += entering.T @ entering - leaving.T @ leaving
+        else:
+            self.s = window.sum(axis=0)
+            self.ss = window.T @ window
+
+        self.source, self.bounds, self.window = source, (lo, hi), window
+        n = window.shape[0]
+        return (self.ss - np.outer(self.s, self.s) / n) / (n - 1)
+
+
+def _evolve(R: np.ndarray, W_periods: np.ndarray, step: int, capital: float) -> np.ndarray:
+    """
+    Evolve the capital of every strategy given the weights of each rebalancing period.
+
+    Parameters
+    -----------
+    R : np.ndarray
+        The daily asset returns of the backtesting horizon, shape (n_days, n_assets).
+    W_periods : np.ndarray
+        The weights held during each period, shape (n_periods, n_assets, n_strategies).
+    step : int
+        The number of trading days per rebalancing period.
+    capital : float
+        The initial capital of every strategy.
+
+    Returns:
+    -----------
+    equity : np.ndarray
+        The capital of each strategy over time, shape (n_days + 1, n_strategies).
+    """
+    n_days = R.shape[0]
+    n_periods, n_assets, n_strategies = W_periods.shape
+
+    # Se rellena el horizonte hasta un múltiplo del periodo para agrupar los días por periodo
+    padded = np.zeros((n_periods * step, n_assets), dtype=np.float64)
+    padded[:n_days] = R
+    port_rets = np.einsum('pda,pas->pds', padded.reshape(n_periods, step, n_assets), W_periods)
+
+    equity = np.empty((n_days + 1, n_strategies), dtype=np.float64)
+    equity[0] = capital
+    np.cumprod(1.0 + port_rets.reshape(-1, n_strategies)[:n_days], axis=0, out=equity[1:])
+    equity[1:] *= capital
+
+    return equity
+
 
 class DynamicBacktesting(OptimizePortfolioWeights):
     """
@@ -15,7 +119,10 @@ class DynamicBacktesting(OptimizePortfolioWeights):
     portfolio value to evolve day by day.
     """
 
-    def __init__(self, prices, prices_benchmark, capital, rf, months, alpha=95):
+    # Consecutive rebalances solve similar problems, so each one starts from the previous solution
+    _warm_start = True
+
+    def __init__(self, prices, prices_benchmark, capital, rf, months, alpha=95, lookback=None, n_jobs=1):
         """
         Initialize the dynamic backtesting simulation.
 
@@ -33,13 +140,47 @@ class DynamicBacktesting(OptimizePortfolioWeights):
             The number of months per rebalancing period.
         alpha : int | float, optional
             The confidence level for CVaR-based strategies (e.g., 95 for 95% confidence). Defaults to 95.
+        lookback : int, optional
+            The number of trading days used to estimate each rebalance. Defaults to None,
+            which uses exactly one rebalancing period.
+        n_jobs : int, optional
+            The number of threads used to run the six optimizations of each rebalance concurrently.
+            Defaults to 1 (sequential). SLSQP is only thread-safe from SciPy 1.16 on; on older
+            releases a warning is emitted and the optimizations run sequentially.
         """
-        self.prices = prices
-        self.prices_benchmark = prices_benchmark
+        # Se ordenan los precios una sola vez para no hacerlo en cada rebalanceo
+        self.prices = prices if prices.index.is_monotonic_increasing else prices.sort_index()
+        self.prices_benchmark = (prices_benchmark if prices_benchmark.index.is_monotonic_increasing
+                                 else prices_benchmark.sort_index())
+
+        # Copias en orden de columnas (Fortran) para las operaciones por activo de cada ventana
+        self.prices_arr = np.asfortranarray(self.prices.to_numpy(dtype=np.float64))
+        self.prices_benchmark_arr = np.asfortranarray(self.prices_benchmark.to_numpy(dtype=np.float64))
+
+        # Un precio faltante propagaría NaN a todas las curvas de capital, así que se rechaza desde el inicio
+        for name, arr in (('prices', self.prices_arr), ('prices_benchmark', self.prices_benchmark_arr)):
+            if np.isnan(arr).any():
+                raise ValueError(f"{name} contains missing values; fill or drop them before backtesting")
+
+        # Rendimientos de toda la historia, calculados una sola vez (la fila i va del día i al i + 1)
+        self.all_rets = self.prices_arr[1:] / self.prices_arr[:-1] - 1.0
+        self.all_bench_rets = self.prices_benchmark_arr[1:] / self.prices_benchmark_arr[:-1] - 1.0
+
         self.months = months
         self.capital = capital
         self.rf = rf
         self.alpha = alpha
+        self.lookback = lookback
+        self.n_jobs = n_jobs
+        if n_jobs > 1 and not _SLSQP_THREAD_SAFE:
+            warnings.warn(
+                f"SLSQP is not thread-safe in SciPy {scipy.__version__} (1.16 or newer is required), "
+                "so the optimizations run sequentially and n_jobs is ignored",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            self.n_jobs = 1
+        self._cov_state = _RollingCovariance()
 
         # Inicialización dummy del optimizador (se sobreescribe dinámicamente)
         super().__init__(returns=pd.DataFrame(), risk_free=rf)
@@ -55,7 +196,8 @@ class DynamicBacktesting(OptimizePortfolioWeights):
         n_days : int
             The number of trading days per rebalancing window.
         periods : int
-            The current period index (0-based) to select the data slice.
+            The current period index (0-based) to select the data slice. The estimation window ends
+            where this period ends and spans `lookback` days (one period by default).
 
         Returns:
         -----------
@@ -64,31 +206,49 @@ class DynamicBacktesting(OptimizePortfolioWeights):
             (min_var, max_sharpe, min_semivar, max_omega, min_cvar, mcc).
         """
 
-        # Extrae el subconjunto de precios actual para el periodo de optimización
-        temp_data = prices.iloc[int(n_days * periods):int(n_days * (periods + 1)), :]
-
-        #Extrae el subconjunto de precios del benchmark para el periodo de optimización
-        temp_bench = self.prices_benchmark.copy().iloc[int(n_days * periods):int(n_days * (periods + 1)), :]
+        # Límites de la ventana de estimación (por defecto, exactamente un periodo)
+        stop = int(n_days * (periods + 1))
+        lookback = int(n_days) if self.lookback is None else int(self.lookback)
+        start = max(stop - lookback, 0)
 
-        # Calcula los rendimientientos del periodo de optimización
-        temp_rets = temp_data.pct_change().dropna()
+        # Extrae los rendimientos del periodo de optimización de la historia precalculada
+        if prices is self.prices:
+            window_rets = self.all_rets[start:stop - 1]
+        else:
+            temp_data = np.asfortranarray(prices.iloc[start:stop].to_numpy(dtype=np.float64))
+            window_rets = temp_data[1:] / temp_data[:-1] - 1.0
+        temp_rets = pd.DataFrame(window_rets, index=prices.index[start + 1:stop], columns=prices.columns)
 
-        rets_benchmark = temp_bench.pct_change().dropna() # Calcula los rendimientos del benchmark para el periodo de optimización
+        # Extrae los rendimientos del benchmark para el periodo de optimización
+        rets_benchmark = pd.DataFrame(self.all_bench_rets[start:stop - 1],
+                                      index=self.prices_benchmark.index[start + 1:stop],
+                                      columns=self.prices_benchmark.columns)
 
         # --- ACTUALIZACIÓN DEL ESTADO DEL OPTIMIZADOR (HERENCIA) --- #
-        self.rets = temp_rets
-        self.cov = temp_rets.cov()
-        self.n_stocks = temp_rets.shape[1]
-
-        w_minvar = self.opt_min_var()
-        w_sharpe = self.opt_max_sharpe()
-        w_semivar = self.opt_min_semivar(rets_benchmark)
-        w_omega = self.opt_max_omega(rets_benchmark)
-        w_min_cvar = self.opt_min_cvar(self.alpha)
-        w_mcc = self.opt_mcc(self.alpha)
+        # La covarianza se actualiza incrementalmente con los días que entran y salen de la ventana
+        cov = self._cov_state.update(prices, window_rets, start + 1, stop)
+        self._set_returns(temp_rets, cov)
+
+        # Las seis optimizaciones son independientes y solo leen el estado fijado arriba
+        tasks = (
+            (self.opt_min_var,),
+            (self.opt_max_sharpe,),
+            (self.opt_min_semivar, rets_benchmark),
+            (self.opt_max_omega, rets_benchmark),
+            (self.opt_min_cvar, self.alpha),
+            (self.opt_mcc, self.alpha),
+        )
+
+        if self.n_jobs > 1:
+            with ThreadPoolExecutor(max_workers=min(self.n_jobs, len(tasks))) as executor:
+                futures = [executor.submit(*task) for task in tasks]
+                weights = tuple(future.result() for future in futures)
+        else:
+            weights = tuple(fn(*args) for fn, *args in tasks)
 
         # Se devuelven los pesos de los metodos de optimización
-        return w_minvar, w_sharpe, w_semivar, w_omega, w_min_cvar, w_mcc
+        # (min_var, max_sharpe, min_semivar, max_omega, min_cvar, mcc)
+        return weights
 
     def simulation(self):
         """
@@ -105,65 +265,33 @@ class DynamicBacktesting(OptimizePortfolioWeights):
             over time: Min Variance, Sharpe, Semivariance, Omega, Min CVaR, and MCC.
         """
         n_days = round(len(self.prices) / round(len(self.prices) / 252 / (self.months / 12)), 0)
+        step = int(n_days)
 
         # Es el capital inicial de la simulación/bt
         capital = self.capital
 
-        # Se hace una copia de los precios y se extrae el subconjunto de los precios para el period de optimización
-        opt_data = self.prices.copy().iloc[:int(n_days), :]
-
-        # Se hace una copia de los precios y se extrae el subconjunto de los precios para el periodo de simulación/bt
-        backtesting_data = self.prices.copy().iloc[int(n_days):, :]
-
-        # Se calculan los rendimientos del periodo de simulación/bt
-        backtesting_rets = backtesting_data.pct_change().dropna()
-
-        # Se inicializa los contadores de los días y de los periodos
-        day_counter, periods_counter = 0, 0
-
-        # Lista para almacenar el capital a lo largo del tiempo para estrategia
-        minvar, sharpe, semivar, omega, min_cvar, mcc = [capital], [capital], [capital], [capital], [capital], [capital]
-
-        # Se obtienne los pesos optimizados
-        w_minvar, w_sharpe, w_semivar, w_omega, w_min_cvar, w_mcc = self.optimize_weights(opt_data, n_days, 0)
-
-        # Se itera dia a dia para
-        for day in range(len(backtesting_data) - 1):
-
-            # Si el contador de dias es menor al numero de didas de optmización , hace:
-            if day_counter < n_days:
-
-                sharpe.append(sharpe[-1] * (1 + sum(backtesting_rets.iloc[day, :] * w_sharpe)))
-                minvar.append(minvar[-1] * (1 + sum(backtesting_rets.iloc[day, :] * w_minvar)))
-                semivar.append(semivar[-1] * (1 + sum(backtesting_rets.iloc[day, :] * w_semivar)))
-                omega.append(omega[-1] * (1 + sum(backtesting_rets.iloc[day, :] * w_omega)))
-                min_cvar.append(min_cvar[-1] * (1 + sum(backtesting_rets.iloc[day, :] * w_min_cvar)))
-                mcc.append(mcc[-1] * (1 + sum(backtesting_rets.iloc[day, :] * w_mcc)))
-            else:
-
-                w_minvar, w_sharpe, w_semivar, w_omega, w_min_cvar, w_mcc = self.optimize_weights(backtesting_data, n_days, periods_counter)
-
-                sharpe.append(sharpe[-1] * (1 + sum(backtesting_rets.iloc[day, :] * w_sharpe)))
-                minvar.append(minvar[-1] * (1 + sum(backtesting_rets.iloc[day, :] * w_minvar)))
-                semivar.append(semivar[-1] * (1 + sum(backtesting_rets.iloc[day, :] * w_semivar)))
-                omega.append(omega[-1] * (1 + sum(backtesting_rets.iloc[day, :] * w_omega)))
-                min_cvar.append(min_cvar[-1] * (1 + sum(backtesting_rets.iloc[day, :] * w_min_cvar)))
-                mcc.append(mcc[-1] * (1 + sum(backtesting_rets.iloc[day, :] * w_mcc)))
-                periods_counter += 1
-                day_counter = 0
-
-            day_counter += 1
-
-        # Crear DataFrame con los resultados de la simulación/bt
-        df = pd.DataFrame()
-        df['Date'] = backtesting_data.index
-        df['Date'] = pd.to_datetime(df['Date'])
-        df['Min Variance'] = minvar
-        df['Sharpe'] = sharpe
-        df['Semivariance'] = semivar
-        df['Omega'] = omega
-        df['Min CVaR'] = min_cvar
-        df['MCC'] = mcc
-        df.set_index('Date', inplace=True)
+        # Fechas del periodo de simulación/bt (no hace falta copiar los precios)
+        backtesting_dates = self.prices.index[step:]
+
+        # Rendimientos del periodo de simulación/bt tomados de la historia precalculada
+        R = self.all_rets[step:]
+
+        # Pesos de cada periodo (periodos x activos x estrategias), optimizados antes de simular;
+        # el segmento j usa los pesos optimizados con el periodo j de la historia completa
+        n_total = len(backtesting_dates)
+        n_periods = len(range(0, n_total - 1, step))
+        self.W_periods = np.empty((n_periods, self.prices_arr.shape[1], len(_STRATEGIES)), dtype=np.float64)
+        for period in range(n_periods):
+            self.W_periods[period] = np.column_stack(self.optimize_weights(self.prices, n_days, period))
+
+        # Se simula todo el horizonte de una sola vez
+        equity = _evolve(R, self.W_periods, step, capital)
+
+        # Crear DataFrame con los resultados de la simulación/bt directamente desde el arreglo
+        df = pd.DataFrame(
+            equity,
+            index=pd.to_datetime(backtesting_dates).rename('Date'),
+            columns=list(_STRATEGIES)
+        )
 
         return df
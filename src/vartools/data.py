@@ -1,9 +1,40 @@
 """Data download utilities."""
 
-import yfinance as yf
+import hashlib
+import os
+import time
+from pathlib import Path
 
+import pandas as pd
 
-def get_data(stocks: str | list, start_date: str, end_date: str):
+_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "vartools"
+
+
+def _cache_path(stocks: list, start_date: str, end_date: str) -> Path:
+    """
+    Build the on-disk cache location for a download request.
+
+    Parameters
+    -----------
+    stocks : list
+        The stock tickers to download.
+    start_date : str
+        The start date for the data.
+    end_date : str
+        The end date for the data.
+
+    Returns:
+    -----------
+    path : Path
+
+        The cache file for the request, keyed by tickers, dates and price field.
+    """
+
+    key = repr((sorted(stocks), str(start_date), str(end_date), "Close")).encode()
+    return _CACHE_DIR / f"{hashlib.blake2b(key, digest_size=16).hexdigest()}.csv"
+
+
+def get_data(stocks: str | list, start_date: str, end_date: str, cache: bool = False, ttl: float | None = 86400, dtype=None):
     """
     A function to download stock data from Yahoo Finance.
 
@@ -15,6 +46,14 @@ def get_data(stocks: str | list, start_date: str, end_date: str):
         The start date for the data.
     end_date : str
         The end date for the data.
+    cache : bool, optional
+        Whether to store downloads as CSV files under ~/.cache/vartools and reuse them on later
+        calls. Defaults to False.
+    ttl : float | None, optional
+        Seconds a cached download stays valid, so recent end dates get refreshed.
+        None keeps cached downloads forever. Defaults to 86400 (one day).
+    dtype : np.dtype, optional
+        Cast the prices to this type (e.g., np.float32 to halve memory). Defaults to None (float64).
 
     Returns:
     -----------
@@ -25,5 +64,22 @@ def get_data(stocks: str | list, start_date: str, end_date: str):
 
     if isinstance(stocks, str):
         stocks = [stocks]
-    data = yf.download(stocks, start=start_date, end=end_date)['Close'][stocks]
-    return data
+
+    path = _cache_path(stocks, start_date, end_date)
+    if cache and path.exists() and (ttl is None or time.time() - path.stat().st_mtime < ttl):
+        data = pd.read_csv(path, index_col=0, parse_dates=True, float_precision='round_trip')[stocks]
+        return data if dtype is None else data.astype(dtype, copy=False)
+
+    import yfinance as yf
+
+    data = yf.download(stocks, start=start_date, end=end_date)['Close']
+
+    if cache and not data.empty:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            data.to_csv(path)
+        except OSError:
+            pass
+
+    data = data[stocks]
+    return data if dtype is None else data.astype(dtype, copy=False)
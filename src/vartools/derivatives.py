@@ -1,135 +1,183 @@
 """Derivatives pricing and hedging (Black-Scholes model)."""
 
+import math
+
 import numpy as np
-import pandas as pd
-from scipy.stats import norm
+from scipy.special import ndtr
+
+
+def _ncdf(x):
+    """
+    Standard normal CDF, using math.erf for Python scalars and the ndtr ufunc for arrays.
+    """
+    if isinstance(x, float):
+        return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
+    return ndtr(x)
+
+
+def _calculate_d1(S, k, r, sigma, T):
+    """
+    Compute the d1 term used in the Black-Scholes model.
+
+    Parameters
+    -----------
+    S : float
+        Current stock price.
+    k : float
+        Strike price of the option.
+    r : float
+        Risk-free interest rate.
+    sigma : float
+        Volatility of the stock.
+    T : float
+        Time to maturity (in years).
+
+    Returns:
+    --------
+    float
+
+        The d1 value used in the Black-Scholes formula.
+    """
+    # Degenerate inputs (T <= 0, sigma <= 0, S / k <= 0) use NumPy, which gives inf or nan instead of raising
+    if all(isinstance(x, (int, float)) for x in (S, k, r, sigma, T)) and sigma > 0 and T > 0 and S / k > 0:
+        return (math.log(S / k) + (r + 0.5 * sigma * sigma) * T) / (sigma * math.sqrt(T))
+    return (np.log(S / k) + (r + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
+
+
+def call_delta(S, k, r, sigma, T):
+    """
+    Compute the delta of a European call option.
+
+    Parameters
+    -----------
+    S : float
+        Current stock price.
+    k : float
+        Strike price of the option.
+    r : float
+        Risk-free interest rate.
+    sigma : float
+        Volatility of the stock.
+    T : float
+        Time to maturity (in years).
+
+    Returns:
+    --------
+    float
+
+        Delta of the call option.
+    """
+    return _ncdf(_calculate_d1(S, k, r, sigma, T))
+
+
+def put_delta(S, k, r, sigma, T):
+    """
+    Compute the delta of a European put option.
+
+    Parameters
+    -----------
+    S : float
+        Current stock price.
+    k : float
+        Strike price of the option.
+    r : float
+        Risk-free interest rate.
+    sigma : float
+        Volatility of the stock.
+    T : float
+        Time to maturity (in years).
+
+    Returns:
+    --------
+    float
+
+        Delta of the put option.
+    """
+    return abs(_ncdf(_calculate_d1(S, k, r, sigma, T)) - 1)
+
+
+def delta_hedge(info_call, info_put):
+    """
+    Compute the total delta of a portfolio containing multiple call and put options.
+
+    Parameters
+    -----------
+    info_call : list of lists
+        Each inner list contains the parameters [S, K, r, sigma, T, N] for a call option:
+        - S: Current stock price
+        - K: Strike price
+        - r: Risk-free interest rate
+        - sigma: Volatility
+        - T: Time to maturity
+        - N: Number of contracts
+
+    info_put : list of lists
+        Each inner list contains the parameters [S, K, r, sigma, T, N] for a put option:
+        - S: Current stock price
+        - K: Strike price
+        - r: Risk-free interest rate
+        - sigma: Volatility
+        - T: Time to maturity
+        - N: Number of contracts
+
+    Returns:
+    --------
+    float
+
+        The total delta of the portfolio.
+    """
+
+    # Arrays of shape (n_options, 6) for call and put options
+    calls = np.asarray(info_call, dtype=np.float64).reshape(-1, 6)
+    puts = np.asarray(info_put, dtype=np.float64).reshape(-1, 6)
+
+    # Deltas for the whole book in a single vectorized call
+    call_deltas = call_delta(*calls[:, :5].T)
+    put_deltas = put_delta(*puts[:, :5].T)
+
+    return calls[:, 5] @ call_deltas - puts[:, 5] @ put_deltas
 
 
 class BlackScholes:
-    def __init__(self):
-        """
-        A class to implement the Black-Scholes model for option pricing and delta hedging.
+    """
+    A class to implement the Black-Scholes model for option pricing and delta hedging.
 
-        Methods:
-        --------
-        - call_delta(S, k, r, sigma, T): Computes the delta of a European call option.
-        - put_delta(S, k, r, sigma, T): Computes the delta of a European put option.
-        - delta_hedge(info_call, info_put): Computes the total delta of a portfolio of call and put options.
-        """
+    The methods are thin wrappers around the stateless module-level functions, so no
+    state is kept between calls and the functions can also be used directly.
+
+    Methods:
+    --------
+    - call_delta(S, k, r, sigma, T): Computes the delta of a European call option.
+    - put_delta(S, k, r, sigma, T): Computes the delta of a European put option.
+    - delta_hedge(info_call, info_put): Computes the total delta of a portfolio of call and put options.
+    """
 
-    def _calculate_d1(self, S, k, r, sigma, T):
+    @staticmethod
+    def _calculate_d1(S, k, r, sigma, T):
         """
-        Compute the d1 term used in the Black-Scholes model.
-
-        Parameters
-        -----------
-        S : float
-            Current stock price.
-        k : float
-            Strike price of the option.
-        r : float
-            Risk-free interest rate.
-        sigma : float
-            Volatility of the stock.
-        T : float
-            Time to maturity (in years).
-
-        Returns:
-        --------
-        float
-
-            The d1 value used in the Black-Scholes formula.
+        Compute the d1 term used in the Black-Scholes model. See `_calculate_d1`.
         """
-        return (np.log(S / k) + (r + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
+        return _calculate_d1(S, k, r, sigma, T)
 
     # Deltas
-    def call_delta(self, S, k, r, sigma, T):
+    @staticmethod
+    def call_delta(S, k, r, sigma, T):
         """
-        Compute the delta of a European call option.
-
-        Parameters
-        -----------
-        S : float
-            Current stock price.
-        k : float
-            Strike price of the option.
-        r : float
-            Risk-free interest rate.
-        sigma : float
-            Volatility of the stock.
-        T : float
-            Time to maturity (in years).
-
-        Returns:
-        --------
-        float
-
-            Delta of the call option.
+        Compute the delta of a European call option. See `call_delta`.
         """
-        return norm.cdf(self._calculate_d1(S, k, r, sigma, T))
+        return call_delta(S, k, r, sigma, T)
 
-    def put_delta(self, S, k, r, sigma, T):
+    @staticmethod
+    def put_delta(S, k, r, sigma, T):
         """
-        Compute the delta of a European put option.
-
-        Parameters
-        -----------
-        S : float
-            Current stock price.
-        k : float
-            Strike price of the option.
-        r : float
-            Risk-free interest rate.
-        sigma : float
-            Volatility of the stock.
-        T : float
-            Time to maturity (in years).
-
-        Returns:
-        --------
-        float
-
-            Delta of the put option.
+        Compute the delta of a European put option. See `put_delta`.
         """
-        return np.abs(norm.cdf(self._calculate_d1(S, k, r, sigma, T)) - 1)
+        return put_delta(S, k, r, sigma, T)
 
     # Hedge
-    def delta_hedge(self, info_call, info_put):
+    @staticmethod
+    def delta_hedge(info_call, info_put):
         """
-        Compute the total delta of a portfolio containing multiple call and put options.
-
-        Parameters
-        -----------
-        info_call : list of lists
-            Each inner list contains the parameters [S, K, r, sigma, T, N] for a call option:
-            - S: Current stock price
-            - K: Strike price
-            - r: Risk-free interest rate
-            - sigma: Volatility
-            - T: Time to maturity
-            - N: Number of contracts
-
-        info_put : list of lists
-            Each inner list contains the parameters [S, K, r, sigma, T, N] for a put option:
-            - S: Current stock price
-            - K: Strike price
-            - r: Risk-free interest rate
-            - sigma: Volatility
-            - T: Time to maturity
-            - N: Number of contracts
-
-        Returns:
-        --------
-        float
-
-            The total delta of the portfolio.
+        Compute the total delta of a portfolio containing multiple call and put options. See `delta_hedge`.
         """
-
-        # Dataframe for call and put options
-        df_call = pd.DataFrame(info_call, columns=['S', 'K', 'r', 'sigma', 'T', 'N'])
-        df_put = pd.DataFrame(info_put, columns=['S', 'K', 'r', 'sigma', 'T', 'N'])
-
-        df_call['delta'] = df_call.apply(lambda row: BlackScholes().call_delta(*row[0:-1]), axis=1)
-        df_put['delta'] = df_put.apply(lambda row: BlackScholes().put_delta(*row[0:-1]), axis=1)
-
-        return np.dot(df_call['N'], df_call['delta']) - np.dot(df_put['N'], df_put['delta'])
+        return delta_hedge(info_call, info_put)
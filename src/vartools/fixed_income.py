@@ -17,7 +17,9 @@ Conventions:
     - Prices in same currency units as face value
 """
 
-from typing import List, Tuple
+from typing import Optional, Tuple
+
+import numpy as np
 
 
 class Bond:
@@ -93,6 +95,11 @@ class Bond:
         self.periodic_coupon = (coupon_rate * face_value) / payments_per_year
         self.periodic_yield = yield_to_maturity / payments_per_year
 
+        # Cash flows and discount factors, built on first use by the cash-flow fallback
+        # together with the terms they were built from
+        self._cf_cache: Optional[Tuple[tuple, np.ndarray, np.ndarray]] = None
+        self._df_cache: Optional[Tuple[tuple, np.ndarray]] = None
+
     def _validate_inputs(
         self,
         face_value: float,
@@ -129,26 +136,65 @@ class Bond:
                 f"payments_per_year must be 1, 2, 4, or 12, got {payments_per_year}"
             )
 
-    def _generate_cash_flows(self) -> List[Tuple[int, float]]:
+    def _use_closed_form(self) -> bool:
+        """
+        Check whether the closed-form annuity expressions are numerically safe.
+
+        The closed forms divide by powers of the periodic yield, so for yields
+        near zero (relative to the number of periods) their terms cancel and
+        the cash-flow sum is evaluated directly instead.
+
+        Returns:
+            True if the closed forms can be used for this bond
+        """
+        return abs(self.periodic_yield) * self.total_periods >= 0.5
+
+    def _is_zero_yield(self) -> bool:
         """
-        Generate the bond's cash flow schedule.
+        Check whether the yield is zero, so no cash flow is discounted.
+
+        With (1 + y)^t = 1 for every period, the cash-flow sums reduce to
+        arithmetic series and are evaluated without building any arrays.
+
+        Returns:
+            True if the periodic yield is zero (to machine precision)
+        """
+        return abs(self.periodic_yield) < 1e-15
+
+    def _cash_flows(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build the cash flow schedule as arrays.
+
+        The arrays are shared by price, duration and convexity, and rebuilt
+        whenever the terms they depend on have been changed on the bond.
 
         Returns:
-            List of tuples: [(period_number, cash_flow_amount), ...]
-            where period_number is 1, 2, ..., total_periods
+            Tuple of (period numbers 1..N, amount paid in each period)
+        """
+        key = (self.total_periods, self.periodic_coupon, self.face_value)
+        if self._cf_cache is None or self._cf_cache[0] != key:
+            t = np.arange(1, self.total_periods + 1, dtype=np.float64)
+            cf = np.full(self.total_periods, self.periodic_coupon, dtype=np.float64)
+            cf[-1] += self.face_value  # Final period: coupon + principal repayment
+            self._cf_cache = (key, t, cf)
+        return self._cf_cache[1], self._cf_cache[2]
+
+    def _discount_factors(self) -> np.ndarray:
         """
-        cash_flows = []
+        Compute the discount factors (1 + y)^t for every period.
 
-        for t in range(1, self.total_periods + 1):
-            if t == self.total_periods:
-                # Final period: coupon + principal repayment
-                cf = self.periodic_coupon + self.face_value
-            else:
-                # Regular period: coupon only
-                cf = self.periodic_coupon
-            cash_flows.append((t, cf))
+        Built as a running product of (1 + y), one multiplication per period,
+        instead of raising (1 + y) to each power separately. Like the cash
+        flows, they are shared by price, duration and convexity, and rebuilt
+        whenever the yield or the number of periods has been changed.
 
-        return cash_flows
+        Returns:
+            Array with (1 + y)^t for t = 1, ..., total_periods
+        """
+        key = (self.total_periods, self.periodic_yield)
+        if self._df_cache is None or self._df_cache[0] != key:
+            self._df_cache = (key, np.cumprod(np.full(self.total_periods, 1 + self.periodic_yield)))
+        return self._df_cache[1]
 
     def price(self) -> float:
         """
@@ -165,6 +211,9 @@ class Bond:
                 y = periodic yield (annual yield / payments per year)
                 t = period number
 
+            Evaluated in closed form as an annuity plus the discounted principal:
+            P = C × (1 - v^N) / y + F × v^N,  with v = 1 / (1 + y)
+
         Returns:
             Bond price in same currency units as face_value
 
@@ -173,14 +222,20 @@ class Bond:
             >>> bond.price()
             920.1458...
         """
-        total_pv = 0.0
+        y, N = self.periodic_yield, self.total_periods
+        C, F = self.periodic_coupon, self.face_value
+
+        if self._use_closed_form():
+            vN = (1 + y) ** -N
+            return float(C * (1 - vN) / y + F * vN)
 
-        for t, cf in self._generate_cash_flows():
-            # PV = CF / (1 + y)^t
-            discount_factor = (1 + self.periodic_yield) ** t
-            total_pv += cf / discount_factor
+        if self._is_zero_yield():
+            # Undiscounted: every coupon plus the principal
+            return float(N * C + F)
 
-        return total_pv
+        # PV = CF / (1 + y)^t for every period at once
+        _, cf = self._cash_flows()
+        return float((cf / self._discount_factors()).sum())
 
     def macaulay_duration(self) -> float:
         """
@@ -197,6 +252,9 @@ class Bond:
                 t = time in years to cash flow
                 PV(CF_t) = present value of cash flow at time t
 
+            Evaluated in closed form as D_mac = -(1 + y) × P'(y) / (P × m),
+            where P'(y) is the derivative of the closed-form price.
+
         Returns:
             Duration in years
 
@@ -205,19 +263,28 @@ class Bond:
             - Higher duration = greater sensitivity to interest rate changes
             - Can be thought of as the bond's "effective maturity"
         """
-        bond_price = self.price()
-        weighted_sum = 0.0
+        y, N = self.periodic_yield, self.total_periods
+        C, F = self.periodic_coupon, self.face_value
+
+        if self._use_closed_form():
+            vN = (1 + y) ** -N
+            bond_price = C * (1 - vN) / y + F * vN
+            d_price = -C / y ** 2 * (1 - vN) - (F - C / y) * N * vN / (1 + y)
+            return float(-(1 + y) * d_price / bond_price / self.payments_per_year)
 
-        for t, cf in self._generate_cash_flows():
-            # Present value of this cash flow
-            pv = cf / ((1 + self.periodic_yield) ** t)
+        if self._is_zero_yield():
+            # Σ t × CF_t with Σ t = N(N+1)/2 for the coupons
+            bond_price = N * C + F
+            return float((C * N * (N + 1) / 2 + F * N) / bond_price / self.payments_per_year)
 
-            # Weight by time (in periods)
-            weighted_sum += t * pv
+        # Present value of each cash flow
+        t, cf = self._cash_flows()
+        pv = cf / self._discount_factors()
+        bond_price = pv.sum()
 
-        # Duration in periods, convert to years
-        duration_in_periods = weighted_sum / bond_price
-        return duration_in_periods / self.payments_per_year
+        # Weight by time (in periods), then convert the duration to years
+        duration_in_periods = (t * pv).sum() / bond_price
+        return float(duration_in_periods / self.payments_per_year)
 
     def modified_duration(self) -> float:
         """
@@ -250,7 +317,7 @@ class Bond:
         """
         return self.macaulay_duration() / (1 + self.periodic_yield)
 
-    def convexity(self) -> float:
+    def convexity(self, bond_price: Optional[float] = None) -> float:
         """
         Calculate bond convexity.
 
@@ -267,6 +334,14 @@ class Bond:
                 P = bond price
                 m = payments per year
 
+            The numerator is the second derivative of the price with respect to y,
+            evaluated in closed form as
+            P''(y) = 2C/y³ × (1 - v^N) - 2CN × v^N / (y² (1+y)) + (F - C/y) × N(N+1) × v^N / (1+y)²
+
+        Args:
+            bond_price: Price of the bond if the caller already computed it
+                       (default: computed here)
+
         Returns:
             Convexity in years squared
 
@@ -282,16 +357,30 @@ class Bond:
             >>> bond.convexity()
             21.9107...
         """
-        bond_price = self.price()
-        convexity_sum = 0.0
-
-        for t, cf in self._generate_cash_flows():
-            # Discount factor for convexity: (1+y)^(t+2)
-            discount = (1 + self.periodic_yield) ** (t + 2)
-            convexity_sum += cf * t * (t + 1) / discount
+        y, N = self.periodic_yield, self.total_periods
+        C, F = self.periodic_coupon, self.face_value
+        if bond_price is None:
+            bond_price = self.price()
+
+        if self._use_closed_form():
+            vN = (1 + y) ** -N
+            convexity_sum = (2 * C / y ** 3 * (1 - vN)
+                             - 2 * C * N * vN / (y ** 2 * (1 + y))
+                             + (F - C / y) * N * (N + 1) * vN / (1 + y) ** 2)
+            return float(convexity_sum / (bond_price * (self.payments_per_year ** 2)))
+
+        if self._is_zero_yield():
+            # Σ t(t+1) × CF_t with Σ t(t+1) = N(N+1)(N+2)/3 for the coupons
+            convexity_sum = C * N * (N + 1) * (N + 2) / 3 + F * N * (N + 1)
+            return float(convexity_sum / (bond_price * (self.payments_per_year ** 2)))
+
+        # Discount factor for convexity: (1+y)^(t+2)
+        t, cf = self._cash_flows()
+        discounts = self._discount_factors() * (1 + y) ** 2
+        convexity_sum = (cf * t * (t + 1) / discounts).sum()
 
         # Normalize by price and convert from periods² to years²
-        return convexity_sum / (bond_price * (self.payments_per_year ** 2))
+        return float(convexity_sum / (bond_price * (self.payments_per_year ** 2)))
 
     def price_change_estimate(self, yield_change: float) -> Tuple[float, float, float]:
         """
@@ -332,9 +421,21 @@ class Bond:
             - Convexity effect is always positive (beneficial for bondholders)
             - Approximation accuracy decreases for very large yield changes
         """
-        d_mod = self.modified_duration()
-        conv = self.convexity()
+        return self._price_change(self.modified_duration(), self.convexity(), yield_change)
+
+    @staticmethod
+    def _price_change(d_mod: float, conv: float, yield_change: float) -> Tuple[float, float, float]:
+        """
+        Apply the duration-convexity approximation to already computed risk measures.
 
+        Args:
+            d_mod: Modified duration
+            conv: Convexity
+            yield_change: Change in yield as decimal
+
+        Returns:
+            Tuple of (total_change, duration_effect, convexity_effect)
+        """
         # First-order effect (linear, from duration)
         duration_effect = -d_mod * yield_change
 
@@ -353,7 +454,12 @@ class Bond:
         Returns:
             Multi-line string with bond details and calculated metrics
         """
-        total_chg, dur_eff, conv_eff = self.price_change_estimate(0.01)
+        # Each measure is computed once and reused below
+        price = self.price()
+        mac = self.macaulay_duration()
+        d_mod = mac / (1 + self.periodic_yield)
+        conv = self.convexity(price)
+        total_chg, dur_eff, conv_eff = self._price_change(d_mod, conv, 0.01)
 
         return f"""
 {'='*50}
@@ -368,13 +474,13 @@ TERMS:
 
 VALUATION:
   Yield to Maturity:    {self.yield_to_maturity*100:.3f}%
-  Price:                ${self.price():,.4f}
-  Price (per 100):      {(self.price()/self.face_value)*100:.4f}
+  Price:                ${price:,.4f}
+  Price (per 100):      {(price/self.face_value)*100:.4f}
 
 RISK METRICS:
-  Macaulay Duration:    {self.macaulay_duration():.4f} years
-  Modified Duration:    {self.modified_duration():.4f}
-  Convexity:            {self.convexity():.4f}
+  Macaulay Duration:    {mac:.4f} years
+  Modified Duration:    {d_mod:.4f}
+  Convexity:            {conv:.4f}
 
 SENSITIVITY (for +100bp yield change):
   Duration Effect:      {dur_eff*100:+.4f}%
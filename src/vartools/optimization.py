@@ -2,11 +2,90 @@
 
 import numpy as np
 import pandas as pd
+from scipy.linalg import LinAlgError, cho_factor, cho_solve
 from scipy.optimize import minimize
 
+from vartools._percentiles import _left_tail_days, _partition_percentiles, _tail, _tail_mean
 from vartools._validation import _validate_confidence
 
 
+def _budget(w: np.ndarray) -> float:
+    """
+    Fully-invested constraint: the weights must sum to one.
+    """
+    return np.sum(w) - 1
+
+
+def _budget_jac(w: np.ndarray) -> np.ndarray:
+    """
+    Gradient of the fully-invested constraint, constant since it is linear.
+    """
+    return np.ones_like(w)
+
+
+# Sum-to-one equality shared by every strategy, with its exact gradient so SLSQP
+# does not finite-difference it
+_BUDGET_CONSTRAINT = {'type': 'eq', 'fun': _budget, 'jac': _budget_jac}
+
+
+def _cvar_objective(w: np.ndarray, returns: np.ndarray, alpha: float) -> float:
+    """
+    CVaR of the portfolio returns, used as the objective of opt_min_cvar.
+
+    Parameters
+    -----------
+    w : np.ndarray
+        The portfolio weights.
+    returns : np.ndarray
+        The daily asset returns, one row per day and one column per asset.
+    alpha : int | float
+        The confidence level for the CVaR calculation (e.g., 95 for 95% confidence).
+
+    Returns:
+    -----------
+    cvar : float
+        The CVaR of the portfolio, as a positive loss.
+    """
+
+    pr = returns @ w
+
+    # Only the values are needed here, so the portfolio returns are partitioned in place
+    part, ((_, lo, hi),), (var,) = _partition_percentiles(pr, [100 - alpha], overwrite_input=True)
+
+    # CVaR as mean of worst returns, reduced straight from the partitioned tail
+    return -_tail_mean(_tail(part, lo, hi, var, inclusive=True), var, inclusive=True)
+
+
+def _max_cvar_contribution(w: np.ndarray, returns: np.ndarray, alpha: float) -> float:
+    """
+    Largest individual asset CVaR contribution, used as the objective of opt_mcc.
+
+    Parameters
+    -----------
+    w : np.ndarray
+        The portfolio weights.
+    returns : np.ndarray
+        The daily asset returns, one row per day and one column per asset.
+    alpha : int | float
+        The confidence level for the CVaR calculation (e.g., 95 for 95% confidence).
+
+    Returns:
+    -----------
+    mcc : float
+        The maximum CVaR contribution across assets.
+    """
+
+    pr = returns @ w
+
+    # Returns of the days in the left tail
+    bad_days = returns[_left_tail_days(pr, 100 - alpha, inclusive=True)]
+
+    # Individual CVaR contributions of all assets at once
+    contributions = -bad_days.mean(axis=0) * w
+
+    return contributions.max()
+
+
 class OptimizePortfolioWeights:
     """
     A class to optimize portfolio weights using various methods. The optimization strategies include:
@@ -18,6 +97,10 @@ class OptimizePortfolioWeights:
         - Minimum CVaR Contribution (MCC)
     """
 
+    # Whether each solve starts from the previous solution of the same strategy. Off here so
+    # results do not depend on call history; DynamicBacktesting turns it on across rebalances
+    _warm_start = False
+
     def __init__(self, returns: pd.DataFrame, risk_free: float):
         """
         Initialize the portfolio optimizer.
@@ -30,35 +113,190 @@ class OptimizePortfolioWeights:
             The annualized risk-free rate (e.g., 0.04 for 4%).
         """
 
-        self.rets = returns
-        self.cov = returns.cov()
+        # Last optimal weights of each strategy, used to warm-start the next solve
+        self._last_w = {}
+
+        self._set_returns(returns)
         self.rf = risk_free / 252
+
+    @property
+    def rets(self) -> pd.DataFrame:
+        """
+        The daily asset returns being optimized. Assigning new returns refreshes the cached
+        NumPy statistics (mean, covariance and correlation) the objectives read.
+        """
+        return self._rets
+
+    @rets.setter
+    def rets(self, returns: pd.DataFrame):
+        self._set_returns(returns)
+
+    @property
+    def cov(self) -> pd.DataFrame:
+        """
+        The covariance matrix of the returns. Assigning a new matrix refreshes the cached
+        covariance and correlation arrays the objectives read.
+        """
+        return self._cov_df
+
+    @cov.setter
+    def cov(self, cov):
+        self._set_cov(cov)
+
+    def _set_returns(self, returns: pd.DataFrame, cov: np.ndarray | None = None):
+        """
+        Set the returns to optimize over and precompute their NumPy statistics.
+
+        The objectives are evaluated many times per solve, so they read these arrays
+        instead of going through pandas on every call.
+
+        Parameters
+        -----------
+        returns : pd.DataFrame
+            A DataFrame containing daily asset returns, with each column representing an asset.
+        cov : np.ndarray, optional
+            The covariance matrix of the returns, if the caller already has it. Defaults to None.
+        """
+
+        # Previous solutions only make sense as starting points for the same assets
+        if not (hasattr(self, '_rets') and self._rets.columns.equals(returns.columns)):
+            self._last_w = {}
+
+        self._rets = returns
         self.n_stocks = len(returns.columns)
 
+        # Kept in the layout pandas hands out (no contiguous copy): the CVaR objectives are non-smooth,
+        # and a different layout changes the summation order of returns @ w and where SLSQP stops
+        self._R = returns.to_numpy(dtype=np.float64)
+
+        # No statistics to compute without returns (e.g. the placeholder init of DynamicBacktesting)
+        if len(self._R) == 0:
+            self._mu = np.full(self.n_stocks, np.nan)
+        else:
+            self._mu = self._R.mean(axis=0)
+
+        self._set_cov(returns.cov() if cov is None else cov)
+
+    def _set_cov(self, cov):
+        """
+        Set the covariance matrix of the returns and its correlation matrix.
+
+        Parameters
+        -----------
+        cov : pd.DataFrame | np.ndarray
+            The covariance matrix of the returns, in the order of the asset columns.
+        """
+
+        self._cov = np.asarray(cov, dtype=np.float64)
+        columns = self._rets.columns
+        self._cov_df = pd.DataFrame(self._cov, index=columns, columns=columns)
+
+        sd = np.sqrt(np.diag(self._cov))
+        self._corr = self._cov / np.outer(sd, sd)
+
+    def _benchmark_diffs(self, rets_benchmark) -> np.ndarray:
+        """
+        Excess daily returns of every asset over the benchmark.
+
+        Parameters
+        -----------
+        rets_benchmark : pd.DataFrame
+            A DataFrame containing the daily returns of the benchmark.
+
+        Returns:
+        -----------
+        diffs : np.ndarray
+            The asset returns minus the benchmark returns, one row per day and one column per asset.
+        """
+
+        bench = np.asarray(rets_benchmark, dtype=np.float64)
+        if bench.ndim == 1:
+            bench = bench[:, None]
+        return self._R - bench
+
+    def _initial_weights(self, key: str, default: np.ndarray) -> np.ndarray:
+        """
+        Return the starting point for an optimization.
+
+        Parameters
+        -----------
+        key : str | tuple
+            The strategy name, together with its confidence level for the CVaR strategies.
+        default : np.ndarray
+            The starting point used when there is no previous solution for this strategy.
+
+        Returns:
+        -----------
+        w0 : np.ndarray
+            The previous optimal weights of the strategy when warm starts are enabled,
+            otherwise the default.
+        """
+
+        w0 = self._last_w.get(key) if self._warm_start else None
+        return default if w0 is None else w0
+
+    def _remember(self, key: str, result) -> np.ndarray:
+        """
+        Store a successful solution as the warm start for the next solve of the same strategy.
+
+        Parameters
+        -----------
+        key : str | tuple
+            The strategy name, together with its confidence level for the CVaR strategies.
+        result : scipy.optimize.OptimizeResult
+            The result returned by the solver.
+
+        Returns:
+        -----------
+        weights : np.ndarray
+            The optimized weights.
+        """
+
+        if self._warm_start and result.success:
+            self._last_w[key] = result.x
+        return result.x
+
     # Min Variance
     def opt_min_var(self):
         """
         Compute the portfolio weights that minimize total portfolio variance.
 
+        The unconstrained minimum variance portfolio, Σ⁻¹1 / (1ᵀΣ⁻¹1), is solved directly and
+        returned when it has no short positions; otherwise the long-only problem is solved with SLSQP.
+
         Returns:
         -----------
         weights : np.ndarray
             The optimized weights for the minimum variance portfolio.
         """
 
-        def var(w): return w.T @ self.cov @ w
+        cov = self._cov
 
-        w0 = np.ones(self.n_stocks)/self.n_stocks
+        # Closed form through a Cholesky solve, valid when no weight hits the bounds
+        try:
+            w = cho_solve(cho_factor(cov), np.ones(self.n_stocks))
+        except (LinAlgError, ValueError):
+            w = None
+        if w is not None and np.all(np.isfinite(w)) and w.sum() > 0:
+            w = w / w.sum()
+            if np.all(w >= 0):
+                if self._warm_start:
+                    self._last_w['min_var'] = w
+                return w
 
-        bounds = [(0, 1)] * self.n_stocks
+        def var(w): return w.T @ cov @ w
+
+        def var_jac(w): return 2 * (cov @ w)
+
+        w0 = self._initial_weights('min_var', np.ones(self.n_stocks)/self.n_stocks)
 
-        def constraint(w): return sum(w)-1
+        bounds = [(0, 1)] * self.n_stocks
 
-        result = minimize(fun=var, x0=w0, bounds=bounds,
-                          constraints={'fun': constraint, 'type': 'eq'},
+        result = minimize(fun=var, x0=w0, jac=var_jac, bounds=bounds,
+                          constraints=_BUDGET_CONSTRAINT,
                           tol=1e-16)
 
-        return result.x
+        return self._remember('min_var', result)
 
     # Sharpe Ratio
     def opt_max_sharpe(self):
@@ -70,18 +308,24 @@ class OptimizePortfolioWeights:
         weights : np.ndarray
             The optimized weights for the maximum Sharpe ratio portfolio.
         """
-        rets = self.rets
-        rend, cov, rf = self.rets.mean(), self.cov, self.rf
+        rend, cov, rf = self._mu, self._cov, self.rf
 
         def sr(w): return -((np.dot(rend, w) - rf) /
                             ((w.reshape(-1, 1).T @ cov @ w) ** 0.5))
 
-        result = minimize(sr, np.ones(len(rets.T)), bounds=[(0, None)] * len(rets.T),
-                          constraints={'fun': lambda w: sum(
-                              w) - 1, 'type': 'eq'},
+        def sr_jac(w):
+            # Quotient rule on -(rend·w - rf) / sqrt(w'Σw)
+            cov_w = cov @ w
+            sd = np.sqrt(w @ cov_w)
+            return -(rend * sd - (np.dot(rend, w) - rf) * cov_w / sd) / sd ** 2
+
+        w0 = self._initial_weights('max_sharpe', np.ones(self.n_stocks))
+
+        result = minimize(sr, w0, jac=sr_jac, bounds=[(0, None)] * self.n_stocks,
+                          constraints=_BUDGET_CONSTRAINT,
                           tol=1e-16)
 
-        return result.x
+        return self._remember('max_sharpe', result)
 
     # Semivariance method
     def opt_min_semivar(self, rets_benchmark):
@@ -99,28 +343,27 @@ class OptimizePortfolioWeights:
             The optimized weights for the minimum semivariance portfolio.
         """
 
-        rets, corr = self.rets.copy(), self.rets.corr()
-
-        diffs = rets-rets_benchmark.values
+        diffs = self._benchmark_diffs(rets_benchmark)
 
-        below_zero_target = diffs[diffs < 0].fillna(0)
-        target_downside = np.array(below_zero_target.std())
+        # Downside deviation of each asset below the benchmark
+        below_zero_target = np.where(diffs < 0, diffs, 0.0)
+        target_downside = below_zero_target.std(axis=0, ddof=1)
 
-        target_semivariance = np.multiply(target_downside.reshape(
-            len(target_downside), 1), target_downside) * corr
+        # diag(σ⁻) · corr · diag(σ⁻)
+        target_semivariance = np.outer(target_downside, target_downside) * self._corr
 
         def semivar(w): return w.T @ target_semivariance @ w
 
-        w0 = np.ones(self.n_stocks)/self.n_stocks
+        def semivar_jac(w): return 2 * (target_semivariance @ w)
+
+        w0 = self._initial_weights('min_semivar', np.ones(self.n_stocks)/self.n_stocks)
 
         bounds = [(0, 3)] * self.n_stocks
 
-        def constraint(w): return sum(w)-1
+        result = minimize(fun=semivar, x0=w0, jac=semivar_jac, bounds=bounds,
+                          constraints=_BUDGET_CONSTRAINT, tol=1e-16)
 
-        result = minimize(fun=semivar, x0=w0, bounds=bounds,
-                          constraints={'fun': constraint, 'type': 'eq'}, tol=1e-16)
-
-        return result.x
+        return self._remember('min_semivar', result)
 
     # Omega
     def opt_max_omega(self, rets_benchmark):
@@ -138,29 +381,27 @@ class OptimizePortfolioWeights:
             The optimized weights for the maximum Omega ratio portfolio.
         """
 
-        rets = self.rets.copy()
-
-        diffs = rets-rets_benchmark.values
+        diffs = self._benchmark_diffs(rets_benchmark)
 
-        below_zero_target = diffs[diffs < 0].fillna(0)
-        above_zero_target = diffs[diffs > 0].fillna(0)
+        below_zero_target = np.where(diffs < 0, diffs, 0.0)
+        above_zero_target = np.where(diffs > 0, diffs, 0.0)
 
-        target_downside = np.array(below_zero_target.std())
-        target_upside = np.array(above_zero_target.std())
+        target_downside = below_zero_target.std(axis=0, ddof=1)
+        target_upside = above_zero_target.std(axis=0, ddof=1)
         o = target_upside/target_downside
 
-        def omega(w): return -sum(o * w)
+        def omega(w): return -(o @ w)
 
-        w0 = np.ones(self.n_stocks)/self.n_stocks
+        def omega_jac(w): return -o
 
-        bounds = [(0, 3)] * self.n_stocks
+        w0 = self._initial_weights('max_omega', np.ones(self.n_stocks)/self.n_stocks)
 
-        def constraint(w): return sum(w)-1
+        bounds = [(0, 3)] * self.n_stocks
 
-        result = minimize(fun=omega, x0=w0, bounds=bounds,
-                          constraints={'fun': constraint, 'type': 'eq'}, tol=1e-16)
+        result = minimize(fun=omega, x0=w0, jac=omega_jac, bounds=bounds,
+                          constraints=_BUDGET_CONSTRAINT, tol=1e-16)
 
-        return result.x
+        return self._remember('max_omega', result)
 
     # Min CVaR
     def opt_min_cvar(self, alpha):
@@ -179,34 +420,22 @@ class OptimizePortfolioWeights:
         """
 
         _validate_confidence(alpha, "alpha")
-        returns = self.rets.values
-
-        def portfolio_returns(w):
-            return returns @ w
-
-        def cvar_objective(w):
-            pr = portfolio_returns(w)
+        returns = self._R
 
-            # Low percentile of returns (left tail)
-            var = np.percentile(pr, 100 - alpha)
-
-            # CVaR as mean of worst returns
-            return -pr[pr <= var].mean()
-
-        w0 = np.ones(self.n_stocks) / self.n_stocks
+        w0 = self._initial_weights(('min_cvar', alpha), np.ones(self.n_stocks) / self.n_stocks)
         bounds = [(0, 1)] * self.n_stocks
-        constraints = [{"type": "eq", "fun": lambda w: np.sum(w) - 1}]
 
         result = minimize(
-            fun=cvar_objective,
+            fun=_cvar_objective,
             x0=w0,
+            args=(returns, alpha),
             method="SLSQP",
             bounds=bounds,
-            constraints=constraints,
+            constraints=_BUDGET_CONSTRAINT,
             tol=1e-8
         )
 
-        return result.x
+        return self._remember(('min_cvar', alpha), result)
 
     # MCC Portfolio
     def opt_mcc(self, alpha):
@@ -225,42 +454,20 @@ class OptimizePortfolioWeights:
         """
 
         _validate_confidence(alpha, "alpha")
-        returns = self.rets
         n_assets = self.n_stocks
+        returns = self._R
 
-        def portfolio_returns(w):
-            return returns.values @ w
-
-        def individual_cvar_contributions(w):
-            pr = portfolio_returns(w)
-
-            # Low percentile of returns (left tail)
-            var = np.percentile(pr, 100 - alpha)
-
-            bad_days = pr <= var
-
-            # Individual CVaR contributions
-            contributions = [
-                -returns.iloc[bad_days, i].mean() * w[i]
-                for i in range(n_assets)
-            ]
-
-            return contributions
-
-        def objective(w):
-            return np.max(individual_cvar_contributions(w))
-
-        w0 = np.ones(n_assets) / n_assets
+        w0 = self._initial_weights(('mcc', alpha), np.ones(n_assets) / n_assets)
         bounds = [(0, 1)] * n_assets
-        constraints = [{"type": "eq", "fun": lambda w: np.sum(w) - 1}]
 
         result = minimize(
-            fun=objective,
+            fun=_max_cvar_contribution,
             x0=w0,
+            args=(returns, alpha),
             method="SLSQP",
             bounds=bounds,
-            constraints=constraints,
+            constraints=_BUDGET_CONSTRAINT,
             tol=1e-8
         )
 
-        return result.x
+        return self._remember(('mcc', alpha), result)
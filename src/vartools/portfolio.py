@@ -1,11 +1,44 @@
 """Portfolio utilities: rebalancing, plotting, and simulation."""
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 
 
-def rebalance_stocks(w_original: list, target_weights: list, data: pd.DataFrame, stocks: list, portfolio_value: float) -> pd.DataFrame:
+class Rebalance(NamedTuple):
+    """
+    Result of rebalance_stocks as plain arrays, one entry per stock.
+    """
+
+    stocks: pd.Index
+    original: np.ndarray
+    target: np.ndarray
+    shares: np.ndarray
+
+    def as_dataframe(self) -> pd.DataFrame:
+        """
+        Build the display table returned by rebalance_stocks by default.
+
+        Returns:
+        -----------
+        w_df : pd.DataFrame
+
+            A DataFrame containing the original and target weights, as well as the number of shares to buy/sell.
+        """
+
+        w_df = pd.DataFrame({
+        "Original Weights": self.original,
+        "Target Weights": self.target,
+        "Shares (Buy/Sell)" : self.shares
+        }, index=self.stocks)
+
+        return w_df.T
+
+
+def rebalance_stocks(w_original: list, target_weights: list, data: pd.DataFrame, stocks: list, portfolio_value: float,
+                     as_frame: bool = True) -> pd.DataFrame | Rebalance:
     """
     Rebalance a portfolio of stocks to achieve target weights.
 
@@ -21,25 +54,29 @@ def rebalance_stocks(w_original: list, target_weights: list, data: pd.DataFrame,
         A list of column names representing the stocks to be included in the portfolio.
     portfolio_value : float
         The total value of the portfolio.
+    as_frame : bool, optional
+        Whether to return the result as a DataFrame. If False, a Rebalance named tuple of
+        arrays is returned instead, which avoids building the DataFrame. Defaults to True.
 
     Returns:
     -----------
-    w_df : pd.DataFrame
+    w_df : pd.DataFrame | Rebalance
 
         A DataFrame containing the original and target weights, as well as the number of shares to buy/sell.
     """
 
-    data = data.sort_index()
-    data = data[stocks]
-    n_stocks = (target_weights - w_original) * portfolio_value / data.iloc[-1]
+    if not data.index.is_monotonic_increasing:
+        data = data.sort_index()
+    last_prices = data.iloc[-1]
+    if list(data.columns) != list(stocks):
+        last_prices = last_prices[stocks]
+    w0 = np.asarray(w_original, dtype=np.float64)
+    wt = np.asarray(target_weights, dtype=np.float64)
+    n_stocks = (wt - w0) * portfolio_value / last_prices.to_numpy(dtype=np.float64)
 
-    w_df = pd.DataFrame({
-    "Original Weights": w_original,
-    "Target Weights": target_weights,
-    "Shares (Buy/Sell)" : n_stocks
-    })
+    result = Rebalance(last_prices.index, w0, wt, n_stocks)
 
-    return w_df.T
+    return result.as_dataframe() if as_frame else result
 
 
 def plot_weights(stocks: list, weights: list | np.ndarray):
@@ -58,22 +95,48 @@ def plot_weights(stocks: list, weights: list | np.ndarray):
         A pie chart showing the portfolio weights.
     """
 
-    df = pd.DataFrame(weights, index=stocks, columns=['w'])
-    filtered_df = df[df['w'] > 0.000001]
-    labels = filtered_df.index
-    values = filtered_df.iloc[: , 0]
+    w = np.asarray(weights, dtype=np.float64).ravel()
+    mask = w > 0.000001
+    labels = np.asarray(stocks)[mask]
+    values = w[mask]
+
+    import matplotlib.pyplot as plt
 
-    plt.rcParams['figure.facecolor'] = 'lightgray'
     cmap = plt.get_cmap("Blues")
     custom_colors = cmap(np.linspace(0, 1, len(labels)))
 
-    plt.figure(figsize=(8, 8))
-    plt.pie(values, labels=labels, autopct='%1.2f%%', startangle=90, colors=custom_colors)
-    plt.title("Portfolio Weights")
-    plt.show()
+    # The background only applies to this figure instead of changing the global rcParams
+    with plt.rc_context({'figure.facecolor': 'lightgray'}):
+        plt.figure(figsize=(8, 8))
+        plt.pie(values, labels=labels, autopct='%1.2f%%', startangle=90, colors=custom_colors)
+        plt.title("Portfolio Weights")
+        plt.show()
+
+
+def _simulate_chunk(out: np.ndarray, seed: np.random.SeedSequence, drift: float, loadings: np.ndarray) -> None:
+    """
+    Simulate a block of portfolio paths in place.
+
+    Parameters
+    -----------
+    out : np.ndarray
+        The (days, n_paths) slice of the result to fill with cumulative portfolio values.
+    seed : np.random.SeedSequence
+        The seed of this block, so every block draws an independent stream.
+    drift : float
+        The expected daily portfolio return.
+    loadings : np.ndarray
+        The Cholesky factor projected on the weights, L.T @ w.
+    """
+
+    rng = np.random.default_rng(seed)
+    Z = rng.standard_normal((out.shape[0], out.shape[1], len(loadings)))
+    # Drift and the +1 of the gross return fold into one scalar, so the shocks get a single add
+    np.cumprod(Z @ loadings + (1 + drift), axis=0, out=out)
 
 
-def simulate_portfolio(data: pd.DataFrame, weights: list | np.ndarray, days: int, N: int = 10000) -> np.ndarray:
+def simulate_portfolio(data: pd.DataFrame, weights: list | np.ndarray, days: int, N: int = 10000, seed: int | None = None,
+                       chunk_size: int = 512, n_jobs: int = 1) -> np.ndarray:
     """
     Simulate future portfolio price paths using the Cholesky decomposition method,
     preserving asset correlations.
@@ -89,6 +152,15 @@ def simulate_portfolio(data: pd.DataFrame, weights: list | np.ndarray, days: int
         The number of days to simulate forward.
     N : int, optional
         The number of simulation paths. Defaults to 10000.
+    seed : int, optional
+        Seed for the random number generator, for reproducible paths. Defaults to None, which
+        draws the seed from NumPy's global random state, so np.random.seed still applies.
+    chunk_size : int, optional
+        The number of paths simulated per block, which bounds the memory of the random draws.
+        Defaults to 512.
+    n_jobs : int, optional
+        The number of threads used to simulate the blocks concurrently. The paths only depend
+        on the seed and chunk_size, not on n_jobs. Defaults to 1 (sequential).
 
     Returns:
     -----------
@@ -98,18 +170,37 @@ def simulate_portfolio(data: pd.DataFrame, weights: list | np.ndarray, days: int
     """
 
     returns = data.pct_change().dropna()
-    mean_returns = returns.mean()
-    cov_returns = returns.cov()
+    mean_returns = returns.mean().to_numpy(dtype=np.float64)
+    cov_returns = returns.cov().to_numpy(dtype=np.float64)
+    w = np.asarray(weights, dtype=np.float64)
 
-    portfolio_return = np.dot(weights, mean_returns)
-    mean_matrix = np.full(shape=(days, len(weights)), fill_value=portfolio_return)
+    # Each asset drifts with its own mean return, so the portfolio drifts with w · mean
+    portfolio_return = w @ mean_returns
 
     L = np.linalg.cholesky(cov_returns)
-    portfolio_simulated_returns = np.zeros((days, N))
 
-    for m in range(N):
-        Z = np.random.normal(size=(days, len(weights)))
-        daily_returns = mean_matrix.T + L @ Z.T
-        portfolio_simulated_returns[:, m] = np.cumprod(np.dot(weights, daily_returns) + 1)
+    # w · (L @ z) = (L.T @ w) · z, so the correlated shocks reduce to one dot product per day
+    loadings = L.T @ w
+
+    # Without an explicit seed it is drawn from the global state, so np.random.seed keeps runs reproducible
+    if seed is None:
+        seed = int(np.random.randint(2 ** 32, dtype=np.uint32))
+
+    # Paths are simulated in blocks, each with its own random stream spawned from the seed
+    portfolio_simulated_returns = np.empty((days, N), dtype=np.float64)
+    starts = range(0, N, chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+    tasks = [
+        (portfolio_simulated_returns[:, start:start + chunk_size], block_seed, portfolio_return, loadings)
+        for start, block_seed in zip(starts, seeds)
+    ]
+
+    if n_jobs > 1:
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            for future in [executor.submit(_simulate_chunk, *task) for task in tasks]:
+                future.result()
+    else:
+        for task in tasks:
+            _simulate_chunk(*task)
 
     return portfolio_simulated_returns
@@ -3,10 +3,92 @@
 import numpy as np
 import pandas as pd
 
+from vartools._percentiles import _left_tail_days, _partition_percentiles, _tail, _tail_mean
 from vartools._validation import _validate_confidence
 
 
-def var_stocks(data: pd.DataFrame, n_stocks: list, conf: int | float, long: bool, stocks: list) -> pd.DataFrame:
+def _var_cvar(returns: np.ndarray, q: float, left: bool = True) -> tuple[float, float]:
+    """
+    Compute a percentile of the returns and the mean of the returns beyond it.
+
+    A single np.partition places the two order statistics around the percentile, so the tail
+    is read from the partitioned prefix (or suffix) instead of masking the whole array.
+    Results match np.percentile's linear interpolation and a strict `<` (`>` for the right tail) mask.
+
+    Parameters
+    -----------
+    returns : np.ndarray
+        A 1D array of portfolio returns.
+    q : float
+        The percentile to compute, between 0 and 100.
+    left : bool
+        Whether the tail lies below the percentile (long positions) or above it (short positions).
+
+    Returns:
+    -----------
+    var, cvar : tuple[float, float]
+
+        The percentile and the mean of the returns in the tail.
+    """
+    part, ((_, lo, hi),), (var,) = _partition_percentiles(returns, [q])
+
+    return var, _tail_mean(_tail(part, lo, hi, var, left), var, left)
+
+
+def _returns(prices: np.ndarray) -> np.ndarray:
+    """
+    Compute simple returns with one strided division, skipping days with missing prices.
+
+    Parameters
+    -----------
+    prices : np.ndarray
+        Prices in date order, either one series (1D) or one column per asset (2D).
+
+    Returns:
+    -----------
+    returns : np.ndarray
+
+        The returns from each day to the next, without the days where any price is missing.
+    """
+    rt = prices[1:] / prices[:-1] - 1
+    missing = np.isnan(rt) if rt.ndim == 1 else np.isnan(rt).any(axis=1)
+    if missing.any():
+        rt = rt[~missing]
+    return rt
+
+
+def _portfolio_returns(data: pd.DataFrame, weights: list | np.ndarray, dtype=np.float64) -> np.ndarray:
+    """
+    Compute the daily returns of a weighted portfolio of stocks.
+
+    Parameters
+    -----------
+    data : pd.DataFrame
+        A DataFrame containing historical stock prices, indexed by date.
+    weights : list | np.ndarray
+        A list of weights for the portfolio, or a 2D array with one row per portfolio.
+    dtype : np.dtype, optional
+        The floating point type used for the return calculations. Defaults to np.float64.
+
+    Returns:
+    -----------
+    portfolio_returns : np.ndarray
+
+        The daily portfolio returns, in date order (one column per portfolio for 2D weights).
+    """
+    if not data.index.is_monotonic_increasing:
+        data = data.sort_index()
+
+    # One conversion to an array; the returns are computed on it without going back to pandas
+    rt = _returns(data.to_numpy(dtype=dtype))
+
+    # (T, K) @ (K,) maps to a single gemv on whatever layout rt already has (column-major
+    # straight from pandas), so no transposed or contiguous copy of the returns is made.
+    # A stack of weight vectors becomes a single gemm instead of one call per portfolio
+    return rt @ np.asarray(weights, dtype=dtype).T
+
+
+def var_stocks(data: pd.DataFrame, n_stocks: list, conf: int | float, long: bool, stocks: list, dtype=np.float64) -> pd.DataFrame:
     """
     Calculate the Value at Risk (VaR) and Conditional Value at Risk (CVaR) for a portfolio of stocks.
 
@@ -24,6 +106,9 @@ def var_stocks(data: pd.DataFrame, n_stocks: list, conf: int | float, long: bool
         - 0 for short positions
     stocks : list
         A list of column names representing the stocks to be included in the portfolio.
+    dtype : np.dtype, optional
+        The floating point type used for the return calculations. np.float32 halves memory
+        traffic on long histories; the results are returned as float64. Defaults to np.float64.
     Returns:
     -----------
     var_stocks_df : pd.DataFrame
@@ -34,16 +119,21 @@ def var_stocks(data: pd.DataFrame, n_stocks: list, conf: int | float, long: bool
     """
 
     _validate_confidence(conf)
-    data = data.sort_index()
-    data = data[stocks]
-    rt = data.pct_change().dropna()
-    stock_value = n_stocks * data.iloc[-1]
+
+    # Tail side (left for long positions, right for short ones), resolved once
+    q = 100 - conf if long else conf
+    if not data.index.is_monotonic_increasing:
+        data = data.sort_index()
+    if list(data.columns) != list(stocks):
+        data = data.loc[:, stocks]
+    stock_value = np.asarray(n_stocks, dtype=np.float64) * data.iloc[-1].to_numpy(dtype=np.float64)
     portfolio_value = stock_value.sum()
-    w = stock_value / portfolio_value
-    portfolio_return = np.dot(w, rt.T)
+    w = (stock_value / portfolio_value).astype(dtype)
+    portfolio_return = _portfolio_returns(data, w, dtype)
 
-    var_pct = np.percentile(portfolio_return, 100-conf) if long else np.percentile(portfolio_return, conf)
-    cvar_pct = np.abs(portfolio_return[portfolio_return < var_pct].mean()) if long else portfolio_return[portfolio_return > var_pct].mean()
+    var_pct, cvar_pct = _var_cvar(portfolio_return, q, long)
+    var_pct, cvar_pct = float(var_pct), float(cvar_pct)
+    cvar_pct = np.abs(cvar_pct) if long else cvar_pct
 
     var_cash, cvar_cash = np.abs(portfolio_value * var_pct), portfolio_value * cvar_pct
 
@@ -56,7 +146,7 @@ def var_stocks(data: pd.DataFrame, n_stocks: list, conf: int | float, long: bool
     return var_stocks_df
 
 
-def var_forex(data: pd.DataFrame, positions: list, conf: int | float, long: bool, currencies: list) -> pd.DataFrame:
+def var_forex(data: pd.DataFrame, positions: list, conf: int | float, long: bool, currencies: list, dtype=np.float64) -> pd.DataFrame:
     """
     Calculate the Value at Risk (VaR) and Conditional Value at Risk (CVaR) for a portfolio of currencies.
 
@@ -74,6 +164,9 @@ def var_forex(data: pd.DataFrame, positions: list, conf: int | float, long: bool
         - 0 for short positions
     currencies : list
         A list of column names representing the currencies to be included in the portfolio.
+    dtype : np.dtype, optional
+        The floating point type used for the return calculations. np.float32 halves memory
+        traffic on long histories; the results are returned as float64. Defaults to np.float64.
 
     Returns:
     -----------
@@ -85,16 +178,22 @@ def var_forex(data: pd.DataFrame, positions: list, conf: int | float, long: bool
     """
 
     _validate_confidence(conf)
-    data = data.sort_index()
-    data = data[currencies]
-    port = data * positions
-    port['total'] = port.sum(axis=1)
-    portfolio_return = port['total'].pct_change().dropna()
 
-    var_porcentual = np.percentile(portfolio_return, 100-conf) if long else np.percentile(portfolio_return, conf)
-    cvar_porcentual = np.abs(portfolio_return[portfolio_return < var_porcentual].mean()) if long else portfolio_return[portfolio_return > var_porcentual].mean()
+    # Tail side (left for long positions, right for short ones), resolved once
+    q = 100 - conf if long else conf
+    if not data.index.is_monotonic_increasing:
+        data = data.sort_index()
+    if list(data.columns) != list(currencies):
+        data = data.loc[:, currencies]
+    total = data.to_numpy(dtype=dtype) @ np.asarray(positions, dtype=dtype)
+    portfolio_return = _returns(total)
+    portfolio_value = data.iloc[-1].to_numpy(dtype=np.float64) @ np.asarray(positions, dtype=np.float64)
+
+    var_porcentual, cvar_porcentual = _var_cvar(portfolio_return, q, long)
+    var_porcentual, cvar_porcentual = float(var_porcentual), float(cvar_porcentual)
+    cvar_porcentual = np.abs(cvar_porcentual) if long else cvar_porcentual
 
-    var_cash, cvar_cash = np.abs(port['total'].iloc[-1] * var_porcentual), port['total'].iloc[-1] * cvar_porcentual
+    var_cash, cvar_cash = np.abs(portfolio_value * var_porcentual), portfolio_value * cvar_porcentual
 
     var_df = pd.DataFrame({
         "Métrica": ["VaR", "cVaR"],
@@ -105,7 +204,7 @@ def var_forex(data: pd.DataFrame, positions: list, conf: int | float, long: bool
     return var_df
 
 
-def var_weights(data: pd.DataFrame, weights: list | np.ndarray, conf: int | float) -> float:
+def var_weights(data: pd.DataFrame, weights: list | np.ndarray, conf: int | float | list, dtype=np.float64) -> float | np.ndarray:
     """
     A function to calculate the Value at Risk (VaR) for a portfolio of stocks.
 
@@ -114,25 +213,33 @@ def var_weights(data: pd.DataFrame, weights: list | np.ndarray, conf: int | floa
     data : pd.DataFrame
         A DataFrame containing historical stock prices, indexed by date.
     weights : list | np.ndarray
-        A list of weights for the portfolio.
-    conf : int | float
-        The confidence level for the VaR calculation (e.g., 95 for 95% confidence).
+        A list of weights for the portfolio, or a 2D array with one row of weights per portfolio
+        (e.g., Monte-Carlo samples of weights) to evaluate them all in a single pass.
+    conf : int | float | list
+        The confidence level for the VaR calculation (e.g., 95 for 95% confidence), or a list
+        of them (e.g., [90, 95, 99]) to compute them all with a single partition of the returns.
+    dtype : np.dtype, optional
+        The floating point type used for the return calculations. np.float32 halves memory
+        traffic on long histories; the results are returned as float64. Defaults to np.float64.
 
     Returns:
     -----------
-    var : float
+    var : float | np.ndarray
 
-        The VaR value for the portfolio.
+        The VaR value for the portfolio, or an array with one value per confidence level
+        when conf is a list. For 2D weights there is one row per portfolio.
     """
 
-    _validate_confidence(conf)
-    data = data.sort_index()
-    rt = data.pct_change().dropna()
-    portfolio_returns = np.dot(weights, rt.T)
-    return np.abs(np.percentile(portfolio_returns, 100-conf))
+    confs = np.atleast_1d(conf)
+    for c in confs:
+        _validate_confidence(c)
+    portfolio_returns = _portfolio_returns(data, weights, dtype)
+    _, _, var = _partition_percentiles(portfolio_returns, [100-c for c in confs])
+    var = np.abs(np.array(var, dtype=np.float64))
+    return var.T if np.ndim(conf) else var[0]
 
 
-def cvar_weights(data: pd.DataFrame, weights: list | np.ndarray, conf: int | float) -> float:
+def cvar_weights(data: pd.DataFrame, weights: list | np.ndarray, conf: int | float | list, dtype=np.float64) -> float | np.ndarray:
     """
     A function to calculate the Conditional Value at Risk (CVaR) for a portfolio of stocks.
 
@@ -141,24 +248,32 @@ def cvar_weights(data: pd.DataFrame, weights: list | np.ndarray, conf: int | flo
     data : pd.DataFrame
         A DataFrame containing historical stock prices, indexed by date.
     weights : list | np.ndarray
-        A list of weights for the portfolio.
-    conf : int | float
-        The confidence level for the CVaR calculation (e.g., 95 for 95% confidence).
+        A list of weights for the portfolio, or a 2D array with one row of weights per portfolio
+        (e.g., Monte-Carlo samples of weights) to evaluate them all in a single pass.
+    conf : int | float | list
+        The confidence level for the CVaR calculation (e.g., 95 for 95% confidence), or a list
+        of them (e.g., [90, 95, 99]) to compute them all with a single partition of the returns.
+    dtype : np.dtype, optional
+        The floating point type used for the return calculations. np.float32 halves memory
+        traffic on long histories; the results are returned as float64. Defaults to np.float64.
 
     Returns:
     -----------
-    cvar_pct : float
+    cvar_pct : float | np.ndarray
 
-        The CVaR value for the portfolio.
+        The CVaR value for the portfolio, or an array with one value per confidence level
+        when conf is a list. For 2D weights there is one row per portfolio.
     """
 
-    _validate_confidence(conf)
-    data = data.sort_index()
-    rt = data.pct_change().dropna()
-    portfolio_returns = np.dot(weights, rt.T)
-    var = np.percentile(portfolio_returns, 100-conf)
-    cvar_pct = np.abs(portfolio_returns[portfolio_returns < var].mean())
-    return cvar_pct
+    confs = np.atleast_1d(conf)
+    for c in confs:
+        _validate_confidence(c)
+    portfolio_returns = _portfolio_returns(data, weights, dtype)
+    part, ranks, var = _partition_percentiles(portfolio_returns, [100-c for c in confs])
+
+    cvar = [_tail_mean(_tail(part, lo, hi, v), v) for (_, lo, hi), v in zip(ranks, var)]
+    cvar_pct = np.abs(np.array(cvar, dtype=np.float64))
+    return cvar_pct.T if np.ndim(conf) else cvar_pct[0]
 
 
 def cvar_contributions(weights: list | np.ndarray, returns: pd.DataFrame, alpha: float) -> list:
@@ -182,32 +297,21 @@ def cvar_contributions(weights: list | np.ndarray, returns: pd.DataFrame, alpha:
     """
 
     _validate_confidence(alpha, "alpha")
-    n_assets = len(weights)
-
-    def portfolio_return(returns, weights):
-        return np.dot(returns, weights)
-
-    def individual_cvar_contributions(weights, returns, alpha):
-        portfolio_returns = portfolio_return(returns, weights)
-        var = np.percentile(portfolio_returns, 100 - alpha)
-
-        # check which days are in the cvar for the portfolio
-        bad_days_portfolio = portfolio_returns < var
+    returns = np.asarray(returns, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
 
-        contributions = []
-        # check the returns of each asset the days where the portfolio is in the cvar to know the contribution
-        for i in range(n_assets):
-            asset_contribution = -returns.iloc[:, i][bad_days_portfolio].mean() * weights[i]
-            contributions.append(asset_contribution)
+    portfolio_returns = returns @ weights
 
-        return contributions
+    # check which days are in the cvar for the portfolio
+    bad_days_portfolio = _left_tail_days(portfolio_returns, 100 - alpha)
 
-    contributions = individual_cvar_contributions(weights, returns, alpha)
+    # check the returns of every asset the days where the portfolio is in the cvar to know the contribution
+    contributions = -returns[bad_days_portfolio].mean(axis=0) * weights
 
-    return contributions
+    return contributions.tolist()
 
 
-def var_apl(data: pd.DataFrame, posiciones: list | np.ndarray, conf: float, long: bool):
+def var_apl(data: pd.DataFrame, posiciones: list | np.ndarray, conf: float, long: bool, dtype=np.float64):
     """
     A function that calculates the Value at Risk (VaR) and Conditional Value at Risk (CVaR) adjusted by liquidity cost for a portfolio.
 
@@ -223,6 +327,10 @@ def var_apl(data: pd.DataFrame, posiciones: list | np.ndarray, conf: float, long
         Indicates the position type:
         - 1 for long positions
         - 0 for short positions
+    dtype : np.dtype, optional
+        The floating point type used for the mid, spread and return series. np.float32 halves
+        the memory of the working buffer on long histories; position values and cash results
+        are kept in float64. Defaults to np.float64.
 
     Returns:
     -----------
@@ -232,57 +340,76 @@ def var_apl(data: pd.DataFrame, posiciones: list | np.ndarray, conf: float, long
     """
 
     _validate_confidence(conf)
-    data = data.sort_index()
+
+    # Tail side (left for long positions, right for short ones), resolved once
+    q = 100 - conf if long else conf
+    side = 1.0 if long else -1.0
+
+    # data is only read below, so an already sorted frame is used as is
+    if not data.index.is_monotonic_increasing:
+        data = data.sort_index()
 
     # Bid y Ask
     bid_columns = [col for col in data.columns if 'Bid' in col]
     ask_columns = [col for col in data.columns if 'Ask' in col]
-
+    # Bid and Ask are taken with a single selection of data; bid and ask are views of the same array
+    quotes = data[bid_columns + ask_columns].to_numpy(dtype=dtype)
+    n_days, n_currencies = quotes.shape[0], len(bid_columns)
+    bid = quotes[:, :n_currencies]
+    ask = quotes[:, n_currencies:]
+
+    # One column-major array (Mid | Spread | Return | port_ret) instead of inserting columns into data
+    buffer = np.empty((n_days, 3 * n_currencies + 1), dtype=dtype, order='F')
+    mid = buffer[:, :n_currencies]
+    spread = buffer[:, n_currencies:2 * n_currencies]
+    returns = buffer[:, 2 * n_currencies:3 * n_currencies]
+    port_ret = buffer[:, 3 * n_currencies]
+
+    # Each series is written straight into its block of the buffer, without temporaries
     # Mid
-    mid_columns = [f'Mid.{i}' for i in range(len(bid_columns))]
-    data[mid_columns] = (data[bid_columns].values + data[ask_columns].values) / 2
+    np.add(bid, ask, out=mid)
+    mid *= 0.5
 
     # Spreads
-    spread_columns = [f'Spread.{i}' for i in range(len(bid_columns))]
-    data[spread_columns] = (data[ask_columns].values - data[bid_columns].values) / data[mid_columns].values
+    np.subtract(ask, bid, out=spread)
+    spread /= mid
 
     # Returns
-    return_columns = [f'Return.{i}' for i in range(len(mid_columns))]
-    data[return_columns] = data[mid_columns].pct_change()
+    returns[0] = np.nan
+    np.divide(mid[1:], mid[:-1], out=returns[1:])
+    returns[1:] -= 1
 
     # Weights
-    value = posiciones * data[mid_columns].iloc[-1].values
+    value = np.asarray(posiciones, dtype=np.float64) * mid[-1].astype(np.float64)
     pv = np.sum(value)
-    w = value / pv
+    w = (value / pv).astype(dtype, copy=False)
 
-    # Portfolio return
-    data['port_ret'] = np.dot(data[return_columns], w)
+    # Portfolio return: a single gemv written straight into its column of the buffer
+    np.dot(returns, w, out=port_ret)
 
-    # VaR calculation
-    var_pct = np.percentile(data['port_ret'].dropna(), 100 - conf) if long else np.percentile(data['port_ret'].dropna(), conf)
+    # VaR and C-VaR calculation on the return array
+    port_ret = port_ret[~np.isnan(port_ret)]
+    var_pct, cvar_pct = _var_cvar(port_ret, q, long)
+    var_pct, cvar_pct = np.float64(var_pct), np.float64(cvar_pct)
     var_cash = pv * var_pct
-
-    # C-VaR calculation
-    cvar_pct = data['port_ret'][data['port_ret'] < var_pct].dropna().mean() if long else data['port_ret'][data['port_ret'] > var_pct].dropna().mean()
     cvar_cash = pv * cvar_pct
 
-    # Liquidity cost
-    cl_prom = data[spread_columns].mean()
-    cl_estr = np.percentile(data[spread_columns], 99, axis=0)
+    # Liquidity cost: average (row 0) and stressed (row 1) spread of each currency
+    cl = np.empty((2, n_currencies), dtype=np.float64)
+    cl[0] = np.nanmean(spread, axis=0)
+    cl[1] = np.percentile(spread, 99, axis=0)
 
-    # VaR adjusted by liquidity cost
-    var_apl_prom, var_apl_estr = np.abs(((var_pct - np.dot(w, cl_prom), var_pct - np.dot(w, cl_estr)) if long
-                                else (var_pct + np.dot(w, cl_prom), var_pct + np.dot(w, cl_estr))))
+    # Liquidity cost of the portfolio (average, stressed), subtracted for long positions and added for short ones
+    cl_pct = side * (cl @ w)
+    cl_cash = side * (cl @ value)
 
-    var_apl_prom_cash, var_apl_estr_cash = np.abs(((var_cash - np.dot(value, cl_prom), var_cash - np.dot(value, cl_estr)) if long
-                                            else (var_cash + np.dot(value, cl_prom), var_cash + np.dot(value, cl_estr))))
+    # VaR adjusted by liquidity cost
+    var_apl_prom, var_apl_estr = np.abs(var_pct - cl_pct)
+    var_apl_prom_cash, var_apl_estr_cash = np.abs(var_cash - cl_cash)
 
     # C-VaR adjusted by liquidity cost
-    cvar_apl_prom, cvar_apl_estr = np.abs(((cvar_pct - np.dot(w, cl_prom), cvar_pct - np.dot(w, cl_estr)) if long
-                                    else (cvar_pct + np.dot(w, cl_prom), cvar_pct + np.dot(w, cl_estr))))
-
-    cvar_apl_prom_cash, cvar_apl_estr_cash = np.abs(((cvar_cash - np.dot(value, cl_prom), cvar_cash - np.dot(value, cl_estr)) if long
-                                            else (cvar_cash + np.dot(value, cl_prom), cvar_cash + np.dot(value, cl_estr))))
+    cvar_apl_prom, cvar_apl_estr = np.abs(cvar_pct - cl_pct)
+    cvar_apl_prom_cash, cvar_apl_estr_cash = np.abs(cvar_cash - cl_cash)
 
     resultados = pd.DataFrame({
         'Métrica': ['VaR', 'VaR Ajustado Promedio', 'VaR Ajustado Estresado', 'C-VaR', 'C-VaR Ajustado Promedio', 'C-VaR Ajustado Estresado'],
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from vartools._percentiles import _left_tail_days
+from vartools.optimization import _cvar_objective
+
+
+def _tied_returns(seed, n=200, step=0.01):
+    # Returns rounded to a coarse grid, so many days share the same value
+    rng = np.random.default_rng(seed)
+    return np.round(rng.normal(0.0, 0.02, n) / step) * step
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("q", [1, 5, 10, 25, 50])
+@pytest.mark.parametrize("inclusive", [True, False])
+def test_left_tail_days_matches_mask_with_ties(seed, q, inclusive):
+    returns = _tied_returns(seed)
+    var = np.percentile(returns, q)
+    expected = np.flatnonzero(returns <= var if inclusive else returns < var)
+
+    np.testing.assert_array_equal(_left_tail_days(returns, q, inclusive), expected)
+
+
+def test_left_tail_days_keeps_all_ties_at_the_percentile():
+    returns = np.array([3.0, 1.0, 1.0, 1.0, 2.0, 1.0, 4.0, 1.0, 5.0, 1.0, 1.0, 1.0, 1.0, 6.0])
+    var = np.percentile(returns, 25)
+
+    np.testing.assert_array_equal(_left_tail_days(returns, 25, inclusive=True), np.flatnonzero(returns <= var))
+    np.testing.assert_array_equal(_left_tail_days(returns, 25), np.flatnonzero(returns < var))
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("alpha", [75, 90, 95, 99])
+def test_cvar_objective_matches_mask_with_ties(seed, alpha):
+    rng = np.random.default_rng(seed)
+    returns = np.round(rng.normal(0.0, 0.02, (150, 3)) / 0.01) * 0.01
+    w = np.array([0.5, 0.3, 0.2])
+
+    pr = returns @ w
+    expected = -pr[pr <= np.percentile(pr, 100 - alpha)].mean()
+
+    np.testing.assert_allclose(_cvar_objective(w, returns, alpha), expected, rtol=1e-12)
+
+
+def test_cvar_objective_keeps_all_ties_at_the_percentile():
+    returns = np.array([-3.0, -2.0, -2.0, -2.0, -2.0, -1.0, 0.0, 1.0, -2.0, 2.0, -2.0])[:, None]
+    pr = returns[:, 0]
+    expected = -pr[pr <= np.percentile(pr, 25)].mean()
+
+    assert _cvar_objective(np.ones(1), returns, 75) == pytest.approx(expected)